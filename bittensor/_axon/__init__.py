@@ -126,7 +126,8 @@ class axon:
 
         if config == None: 
             config = axon.config()
-        config = copy.deepcopy(config)
+        config = copy.copy(config)
+        config.axon = copy.deepcopy(config.axon)
         config.axon.port = port if port != None else config.axon.port
         config.axon.ip = ip if ip != None else config.axon.ip
         config.axon.external_ip = external_ip if external_ip != None else config.axon.external_ip
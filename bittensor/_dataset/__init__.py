@@ -73,7 +73,8 @@ class dataset:
         """   
         if config == None: 
             config = dataset.config()
-        config = copy.deepcopy( config )
+        config = copy.copy( config )
+        config.dataset = copy.deepcopy( config.dataset )
         config.dataset.block_size = block_size if block_size != None else config.dataset.block_size
         config.dataset.batch_size = batch_size if batch_size != None else config.dataset.batch_size
         config.dataset.num_workers = num_workers if num_workers != None else config.dataset.num_workers
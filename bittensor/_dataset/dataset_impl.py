@@ -21,7 +21,7 @@ import concurrent
 import json
 import os
 import random
-import time
+import uuid
 from multiprocessing import cpu_count
 from typing import Union
 
@@ -208,11 +208,12 @@ class GenesisTextDataset( Dataset ):
 
         Returns:
             text (str): 
-                The text in the file.                
+                The text in the file, None if the file is missing, unreadable or empty.
         """
 
         full_path = os.path.expanduser(os.path.join(self.data_dir, file_meta['Folder'], file_meta['Hash']))
         if os.path.exists(full_path):
+            text = None
             try:
                 with open(full_path, mode='r') as f:
                     text = f.read()
@@ -222,7 +223,7 @@ class GenesisTextDataset( Dataset ):
                 logger.success("Could not load from disk:".ljust(20) + "<blue>{}</blue>".format(file_meta['Name']))
                 pass
 
-            return text
+            return text if text else None
         
         return None
 
@@ -242,14 +243,23 @@ class GenesisTextDataset( Dataset ):
         full_path = os.path.expanduser(os.path.join(self.data_dir, file_meta['Folder'], file_meta['Hash']))
         if not os.path.exists(folder_path):
             os.makedirs(folder_path)
+        # Write to a temp file and move it into place, so an interrupted save never leaves a truncated file
+        # at full_path that load_hash would serve on every later run.
+        # The temp file is a dotfile so get_text_from_local skips it, and is created with 0o666 so the
+        # saved file keeps the umask-derived permissions of a plain open().
+        temp_path = os.path.join(folder_path, '.{}.{}.tmp'.format(file_meta['Hash'], uuid.uuid4().hex))
         try:
-            with open(full_path, mode = 'w+') as f:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            with os.fdopen(fd, mode = 'w') as f:
                 f.write(text)
-                logger.success("Saved:".ljust(20) + "<blue>{}</blue>".format(file_meta['Name']))
+            os.replace(temp_path, full_path)
+            logger.success("Saved:".ljust(20) + "<blue>{}</blue>".format(file_meta['Name']))
             return True
         
         except Exception as E:
             logger.warning("Save failed:".ljust(20) + "<blue>{}</blue>".format(file_meta['Name']))
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             return False
 
     def get_text(self, file_meta):
@@ -262,7 +272,12 @@ class GenesisTextDataset( Dataset ):
             text (str):
                 The text that we get from the file (from disk or IPFS).     
         """
-        text = None
+        # --- Load text from path, a previous run may have saved it.
+        text = self.load_hash(file_meta)
+        if text != None:
+            return text
+
+        # --- If couldnt load from path, download text.
         response = self.get_ipfs_directory(self.text_dir, file_meta)
         if (response != None) and (response.status_code == 200):
             text = response.text
@@ -429,7 +444,8 @@ class GenesisTextDataset( Dataset ):
 
         files = [] 
         for folder in folders_avail:
-            file_names = os.listdir(os.path.expanduser(os.path.join(self.data_dir, folder)))
+            file_names = [file_name for file_name in os.listdir(os.path.expanduser(os.path.join(self.data_dir, folder)))
+                          if not file_name.startswith('.')]
             sub_files = [{'Name': file_name,'Folder': folder, 'Hash': file_name} for file_name in file_names]
             files += sub_files
 
@@ -599,14 +615,13 @@ class GenesisTextDataset( Dataset ):
         """
         success = False 
         while not success:
-            if not self.data_queue.queue.empty() :
-                ready = self.data_queue.queue.get() # the queue stores a bool ready signal
-                dataset = self.dataloader(self.num_batches)
-                if dataset:
-                    self.__infinite_dataset_iterator = iter([input for input in dataset])
-                    success = True
-            else:
-                time.sleep(2)
+            ready = self.data_queue.queue.get() # blocks until the producer puts a bool ready signal
+            dataset = self.dataloader(self.num_batches)
+            if dataset:
+                # Iterate lazily so batches are tokenized as they are consumed (ahead of time by the
+                # dataloader workers when num_workers > 0) instead of all at once on the calling thread.
+                self.__infinite_dataset_iterator = iter(dataset)
+                success = True
 
         return
 
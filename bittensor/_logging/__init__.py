@@ -71,7 +71,8 @@ class logging:
 
         if config == None: 
             config = logging.config()
-        config = copy.deepcopy(config)
+        config = copy.copy(config)
+        config.logging = copy.deepcopy(config.logging)
         config.logging.debug = debug if debug != None else config.logging.debug
         config.logging.trace = trace if trace != None else config.logging.trace
         config.logging.record_log = record_log if record_log != None else config.logging.record_log
@@ -64,7 +64,8 @@ class metagraph:
         """      
         if config == None: 
             config = metagraph.config()
-        config = copy.deepcopy(config)
+        config = copy.copy(config)
+        config.metagraph = copy.deepcopy(config.metagraph)
         config.metagraph._mock = _mock if _mock != None else config.metagraph._mock
         if config.metagraph._mock:
             return metagraph_mock.MockMetagraph()
@@ -26,7 +26,7 @@ import bittensor
 import os
 
 from .nucleus_impl import server
-from .run import serve
+from .run import serve, TEXT_LAST_HIDDEN_STATE, TEXT_CAUSAL_LM, TEXT_CAUSAL_LM_NEXT, TEXT_SEQ_2_SEQ
 
 class neuron:
     r"""
@@ -78,22 +78,11 @@ class neuron:
         config = config; 
 
         if synapse_list != None:
-            config.neuron.lasthidden = False
-            config.neuron.causallm = False
-            config.neuron.causallmnext = False
-            config.neuron.seq2seq = False
-
-            if bittensor.proto.Synapse.SynapseType.TEXT_LAST_HIDDEN_STATE in synapse_list:
-                config.neuron.lasthidden = True
-            
-            if bittensor.proto.Synapse.SynapseType.TEXT_CAUSAL_LM in synapse_list:
-                config.neuron.causallm = True
-
-            if bittensor.proto.Synapse.SynapseType.TEXT_CAUSAL_LM_NEXT in synapse_list:
-                config.neuron.causallmnext = True
-
-            if bittensor.proto.Synapse.SynapseType.TEXT_SEQ_2_SEQ in synapse_list:
-                config.neuron.seq2seq = True
+            synapse_set = frozenset(synapse_list)
+            config.neuron.lasthidden = TEXT_LAST_HIDDEN_STATE in synapse_set
+            config.neuron.causallm = TEXT_CAUSAL_LM in synapse_set
+            config.neuron.causallmnext = TEXT_CAUSAL_LM_NEXT in synapse_set
+            config.neuron.seq2seq = TEXT_SEQ_2_SEQ in synapse_set
 
         config.neuron.lasthidden = lasthidden if lasthidden != None else config.neuron.lasthidden
         config.neuron.causallm = causallm if causallm != None else config.neuron.causallm
@@ -149,6 +138,5 @@ class neuron:
         bittensor.wandb.check_config( config )
         bittensor.prometheus.check_config( config )
         full_path = os.path.expanduser('{}/{}/{}/{}'.format( config.logging.logging_dir, config.wallet.get('name', bittensor.defaults.wallet.name), config.wallet.get('hotkey', bittensor.defaults.wallet.hotkey), config.neuron.name ))
-        config.neuron.full_path = os.path.expanduser(full_path)
-        if not os.path.exists(config.neuron.full_path):
-            os.makedirs(config.neuron.full_path)
+        config.neuron.full_path = full_path
+        os.makedirs(config.neuron.full_path, exist_ok=True)
@@ -39,6 +39,12 @@ import torch
 import torch.nn.functional as F
 from torch.nn.utils import clip_grad_norm_
 
+# Synapse types bound once at import, they are compared on every request.
+TEXT_LAST_HIDDEN_STATE = bittensor.proto.Synapse.SynapseType.TEXT_LAST_HIDDEN_STATE
+TEXT_CAUSAL_LM = bittensor.proto.Synapse.SynapseType.TEXT_CAUSAL_LM
+TEXT_CAUSAL_LM_NEXT = bittensor.proto.Synapse.SynapseType.TEXT_CAUSAL_LM_NEXT
+TEXT_SEQ_2_SEQ = bittensor.proto.Synapse.SynapseType.TEXT_SEQ_2_SEQ
+
 def serve( 
         config, 
         model,
@@ -67,6 +73,19 @@ def serve(
     
     metagraph.load().sync().save()
 
+    # (hotkey -> uid table, stake list) read on the request path. Rebuilt on every metagraph sync
+    # so that priority and blacklist checks do not scan metagraph.hotkeys for every request.
+    # Both are published as one tuple and each callback reads it once, so an axon thread never
+    # pairs a new table with an old stake list.
+    metagraph_lookups = ({}, [])
+    def update_metagraph_lookups():
+        nonlocal metagraph_lookups
+        hotkey_to_uid = { hotkey: uid for uid, hotkey in enumerate(metagraph.hotkeys) }
+        stakes = [ float(stake) for stake in metagraph.S ]
+        metagraph_lookups = (hotkey_to_uid, stakes)
+
+    update_metagraph_lookups()
+
     # Create our optimizer.
     optimizer = torch.optim.SGD(
         [ {"params": model.parameters()} ],
@@ -104,9 +123,10 @@ def serve(
                 request_type ( bittensor.proto.RequestType, `required`):
                     the request type ('FORWARD' or 'BACKWARD').
         """
+        hotkey_to_uid, stakes = metagraph_lookups
         try:        
-            uid = metagraph.hotkeys.index(pubkey)
-            priority = metagraph.S[uid].item()
+            uid = hotkey_to_uid[pubkey]
+            priority = stakes[uid]
         
         except:
             # zero priority for those who are not registered.
@@ -132,8 +152,10 @@ def serve(
             max_time = synapse.max_time,
             num_beam_groups = synapse.num_beam_groups,
         )
-        raw_texts = [model.tokenizer.decode(out) for out in output]
-        tokens = [model.std_tokenizer.encode(raw_text, return_tensors="pt")[:,:synapse.num_to_generate].view(-1) for raw_text in raw_texts]
+        # decode and re-encode the whole batch in one tokenizer call each, rather than once per sequence.
+        raw_texts = model.tokenizer.batch_decode(output)
+        tokens = model.std_tokenizer(raw_texts)['input_ids']
+        tokens = [torch.tensor(token[:synapse.num_to_generate], dtype=torch.long) for token in tokens]
         bittensor_output = pad_sequence(tokens, batch_first=True)
         return None, model_output, bittensor_output
 
@@ -158,7 +180,7 @@ def serve(
 
     def optimizer_step():
         optimizer.step()
-        optimizer.zero_grad()
+        optimizer.zero_grad(set_to_none=True)
 
     def blacklist(pubkey:str, request_type:bittensor.proto.RequestType) -> bool:
         r"""Axon security blacklisting, used to blacklist message from low stake members
@@ -168,11 +190,13 @@ def serve(
                 request_type ( bittensor.proto.RequestType, `required`):
                     the request type ('FORWARD' or 'BACKWARD').
         """
+        hotkey_to_uid, stakes = metagraph_lookups
+
         # Check for registrations
 
         def registration_check():
             # If we allow non-registered requests return False = not blacklisted.
-            is_registered = pubkey in metagraph.hotkeys
+            is_registered = pubkey in hotkey_to_uid
             if not is_registered:
                 if config.neuron.blacklist_allow_non_registered:
                     return False
@@ -184,8 +208,8 @@ def serve(
         # Check for stake
         def stake_check() -> bool:
             # Check stake.
-            uid = metagraph.hotkeys.index(pubkey)
-            if metagraph.S[uid].item() < config.neuron.blacklist.stake:
+            uid = hotkey_to_uid[pubkey]
+            if stakes[uid] < config.neuron.blacklist.stake:
                 prometheus_counters.labels("blacklisted.stake").inc()
 
                 raise Exception('Stake blacklist')
@@ -234,25 +258,27 @@ def serve(
 
         """
         ## Uid that sent the request
-        incoming_uid = metagraph.hotkeys.index(hotkey)
-        if synapse.synapse_type == bittensor.proto.Synapse.SynapseType.TEXT_LAST_HIDDEN_STATE:
+        hotkey_to_uid, stakes = metagraph_lookups
+        incoming_uid = hotkey_to_uid[hotkey]
+        if synapse.synapse_type == TEXT_LAST_HIDDEN_STATE:
             
-            if metagraph.S[incoming_uid] < config.neuron.lasthidden_stake:
+            if stakes[incoming_uid] < config.neuron.lasthidden_stake:
                 return False
             
-        elif synapse.synapse_type == bittensor.proto.Synapse.SynapseType.TEXT_CAUSAL_LM:
+        elif synapse.synapse_type == TEXT_CAUSAL_LM:
 
-            if metagraph.S[incoming_uid] < config.neuron.causallm_stake:
+            if stakes[incoming_uid] < config.neuron.causallm_stake:
                 return False
 
-        elif synapse.synapse_type == bittensor.proto.Synapse.SynapseType.TEXT_CAUSAL_LM_NEXT:
+        elif synapse.synapse_type == TEXT_CAUSAL_LM_NEXT:
 
-            if metagraph.S[incoming_uid] < config.neuron.causallmnext_stake:
+            if stakes[incoming_uid] < config.neuron.causallmnext_stake:
                 return False
 
-        elif synapse.synapse_type == bittensor.proto.Synapse.SynapseType.TEXT_SEQ_2_SEQ:
+        elif synapse.synapse_type == TEXT_SEQ_2_SEQ:
 
-            if (metagraph.S[incoming_uid] < config.neuron.seq2seq_stake) and (metagraph.S[incoming_uid,  uid]):
+            uid = hotkey_to_uid[wallet.hotkey.ss58_address]
+            if (stakes[incoming_uid] < config.neuron.seq2seq_stake) and (stakes[uid]):
                 return False     
         else:
             return False
@@ -294,13 +320,14 @@ def serve(
                     if synapse.synapse_type in axon.synapse_callbacks and axon.synapse_callbacks[synapse.synapse_type] != None:
                         message, model_output, response_tensor = axon.synapse_callbacks[synapse.synapse_type](inputs_x[index], synapse)
                         grads_dy_norm = grads_dy[index]/(grads_dy[index].sum() + 0.00001)
+                        # Each synapse call runs its own forward, so the graph is freed by the backward
+                        # instead of being kept alive with its activations until model_output is dropped.
                         torch.autograd.backward (
                             tensors = [ response_tensor ],
-                            grad_tensors = [ grads_dy_norm ],
-                            retain_graph=True
+                            grad_tensors = [ grads_dy_norm ]
                         )
                         # Only consider loss from causal LM next.
-                        if synapse.synapse_type == bittensor.proto.Synapse.SynapseType.TEXT_CAUSAL_LM_NEXT:
+                        if synapse.synapse_type == TEXT_CAUSAL_LM_NEXT:
                             model.remote_losses.append(model_output.loss)
                             model.remote_losses = model.remote_losses[-config.neuron.num_remote_loss:] if len(model.remote_losses) > config.neuron.num_remote_loss else model.remote_losses
                         model.backward_gradients_count += inputs_x[index].size(0)
@@ -404,7 +431,7 @@ def serve(
             with mutex:
                 clip_grad_norm_(model.parameters(), 1.0)
                 optimizer.step()
-                optimizer.zero_grad()
+                optimizer.zero_grad(set_to_none=True)
             logger.info('Optimization Successful: Model updated')
 
             if (config.neuron.local_train and iteration > 0):
@@ -457,6 +484,7 @@ def serve(
         if current_block - last_set_block > blocks_per_set_weights:
             bittensor.__console__.print('[green]Current Status:[/green]', {**wandb_data, **local_data})
             metagraph.sync()
+            update_metagraph_lookups()
             last_set_block = current_block
             if not config.neuron.no_set_weights:
                 try: 
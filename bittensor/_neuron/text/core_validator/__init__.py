@@ -32,6 +32,8 @@ import math
 import random
 import pandas
 import traceback
+import queue
+import threading
 from rich import print
 from rich.console import Console
 from rich.style import Style
@@ -48,6 +50,7 @@ from torch.nn.utils import clip_grad_norm_
 from torch.nn import TransformerEncoder, TransformerEncoderLayer
 from loguru import logger
 from threading import Lock
+from concurrent.futures import ThreadPoolExecutor, wait
 from prometheus_client import Counter, Gauge, Histogram, Summary, Info
 
 logger = logger.opt( colors=True )
@@ -179,6 +182,22 @@ class neuron:
         self.loss = None
         self.loss_agg_mutex = Lock()
 
+        # === Weight setting thread ===
+        # Weights are set on a background thread so the next epoch does not wait on extrinsic inclusion.
+        # The thread uses its own subtensor connection since the websocket is not thread-safe.
+        self.weights_executor = ThreadPoolExecutor(max_workers=1)
+        self.weights_subtensor = None
+        self.weights_future = None
+
+        # === Wandb logging thread ===
+        # wandb.log calls are put on a bounded queue and sent by a daemon thread so the step loop
+        # never waits on wandb; the oldest entry is dropped when the queue is full.
+        self.wandb_queue = queue.Queue(maxsize=64)
+        self.wandb_thread = None
+        if self.config.using_wandb:
+            self.wandb_thread = threading.Thread(target=self.wandb_log_worker, daemon=True)
+            self.wandb_thread.start()
+
         # === Neuron statistics variables ===
         self.neuron_stats = {}  # neuron statistics dict of dicts: [uid] -> {'stat1': val1, 'stat2': val2, ...}
         self.neuron_hotkeys = []  # keep neuron hotkeys to compare and check for changes after metagraph.sync()
@@ -221,10 +240,9 @@ class neuron:
         bittensor.axon.check_config( config )
         bittensor.prometheus.check_config( config )
         full_path = os.path.expanduser('{}/{}/{}/{}'.format( config.logging.logging_dir, config.wallet.name, config.wallet.hotkey, config.neuron.name ))
-        config.neuron.full_path = os.path.expanduser(full_path)
+        config.neuron.full_path = full_path
         config.using_wandb = config.wandb.api_key != 'default'
-        if not os.path.exists(config.neuron.full_path):
-            os.makedirs(config.neuron.full_path)
+        os.makedirs(config.neuron.full_path, exist_ok=True)
 
     @classmethod
     def add_args( cls, parser ):
@@ -244,6 +262,8 @@ class neuron:
         parser.add_argument('--neuron.wait_for_finalization', action='store_true', help='''when setting weights the miner waits for trnasaction finalization.''', default=False)
         parser.add_argument('--neuron.forward_num', type=int, help='''How much forward request before a backward call.''', default=3)
         parser.add_argument('--neuron.validation_synapse', type=str, help='''Synapse used for validation.''', default='TextCausalLMNext', choices = ['TextCausalLMNext', 'TextCausalLM'])
+        parser.add_argument('--neuron.autocast', action='store_true', help='''(experimental) Runs the routing model under bfloat16 autocast.''', default=False)
+        parser.add_argument('--neuron.jit', action='store_true', help='''(experimental) Runs the routing encoder through TorchScript, falls back to eager if it cannot be scripted. Ignored with --neuron.autocast.''', default=False)
         parser.add_argument('--neuron.exclude_quantile', type=float, help='Exclude the lowest quantile from weight setting. (default value: -1, pulling from subtensor directly)', default=-1)
 
     @classmethod
@@ -271,6 +291,8 @@ class neuron:
                 f'{self.config.wallet.hotkey}:[bold]{self.wallet.hotkey.ss58_address[:7]}[/bold])')
 
     def __del__(self):
+        # Do not hold up teardown for a whole finalization round, an in-flight submission finishes on its own.
+        self.weights_executor.shutdown(wait=False)
         self.dataset.close()
         self.dendrite.__del__()
 
@@ -278,6 +300,7 @@ class neuron:
         r""" Close down neuron.
         """
         print(exc_type, exc_value, exc_traceback)
+        self.wandb_shutdown()
         self.__del__()
 
     def __enter__(self):
@@ -371,6 +394,7 @@ class neuron:
             self.epoch = 0
             self.global_step = 0
             while True:
+                oom = False
                 try:
 
                     # === Epoch ===
@@ -388,6 +412,12 @@ class neuron:
                     print( 'Unknown exception: {}', e )
                     if not self.config.neuron.restart_on_failure:
                         break
+                    oom = isinstance(e, RuntimeError) and 'CUDA out of memory' in str(e)
+
+                # The failed step's tensors are only released once the exception and its traceback frames
+                # are gone, so the cached blocks are returned to the driver here rather than in the handler.
+                if oom:
+                    torch.cuda.empty_cache()
 
     def run_epoch( self ):
         r""" Runs a validator epoch. We apply batches until the epoch length is exhausted.
@@ -425,11 +455,11 @@ class neuron:
 
         # === Logs ===
         if self.config.using_wandb:
-            wandb.log({'era/batch_size': batch_size, 'era/sequence_length': sequence_length,
-                       'era/validation_len': validation_len,
-                       'era/min_allowed_weights': min_allowed_weights, 'era/max_weight_limit': max_weight_limit,
-                       'era/blocks_per_epoch': blocks_per_epoch, 'era/epochs_until_reset': epochs_until_reset},
-                      step=current_block)
+            self.wandb_log({'era/batch_size': batch_size, 'era/sequence_length': sequence_length,
+                            'era/validation_len': validation_len,
+                            'era/min_allowed_weights': min_allowed_weights, 'era/max_weight_limit': max_weight_limit,
+                            'era/blocks_per_epoch': blocks_per_epoch, 'era/epochs_until_reset': epochs_until_reset},
+                           step=current_block)
 
         # === Run Epoch ===
         # Each block length lasts blocks_per_epoch blocks.
@@ -462,12 +492,13 @@ class neuron:
             # Forwards inputs through the network and returns the loss
             # and endpoint scores using shapely approximation of salience.
             loss, stats = self.nucleus( next(self.dataset) , self.metagraph, self.dendrite )
-            self.prometheus_gauges.labels("loss").set( loss.item() )
+            loss_value = loss.item()
+            self.prometheus_gauges.labels("loss").set( loss_value )
 
             # === Backward ===
             # Backwards gradients through model to train gating and remote endpoints.
             if hasattr(loss, 'grad_fn') and loss.grad_fn is not None:
-                logger.info(f'Backward <dim>(loss: {loss:.3f})</dim>')
+                logger.info(f'Backward <dim>(loss: {loss_value:.3f})</dim>')
                 bw_start_time = time.time()
                 (loss / self.config.neuron.forward_num).backward()
                 logger.info(f'Backward <dim>[{time.time() - bw_start_time:.3g}s]</dim>')
@@ -551,13 +582,14 @@ class neuron:
 
             # === Logs ===
             if self.config.using_wandb:
-                for uid, vals in self.neuron_stats.items():
-                    for key in vals:  # detailed neuron evaluation fields, e.g. loss, shapley_values, synergy
-                        wandb.log({f'stats/{key}_{uid}': vals[key]}, step=current_block, commit=False)
+                # detailed neuron evaluation fields, e.g. loss, shapley_values, synergy
+                wandb_stats = {f'stats/{key}_{uid}': vals[key]
+                               for uid, vals in self.neuron_stats.items() for key in vals}
 
-                wandb.log({'epoch/epoch': self.epoch, 'epoch/epoch_steps': epoch_steps,
-                           'epoch/global_steps': self.global_step, 'epoch/loss': loss.item(),
-                           'epoch/time': step_time}, step=current_block, commit=True)
+                self.wandb_log({**wandb_stats,
+                                'epoch/epoch': self.epoch, 'epoch/epoch_steps': epoch_steps,
+                                'epoch/global_steps': self.global_step, 'epoch/loss': loss_value,
+                                'epoch/time': step_time}, step=current_block, commit=True)
 
             # Do the backward request after the a queue of forward requests got finished.  
             if epoch_steps % self.config.neuron.forward_num == 1:
@@ -568,7 +600,7 @@ class neuron:
                 # Applies local gradients to parameters.
                 clip_grad_norm_(self.nucleus.parameters(), self.config.neuron.clip_gradients)
                 self.optimizer.step()
-                self.optimizer.zero_grad()
+                self.optimizer.zero_grad(set_to_none=True)
                 logger.info(f'Model update \t| Optimizer step <dim>[{time.time() - start_time:.3g}s]</dim>')
 
         self.metagraph_sync()  # Reset metagraph.
@@ -592,12 +624,7 @@ class neuron:
               f'min:[bold]{sample_weights.min().item():.4g}[/bold] [/white] '
               f'\[{max_weight_limit:.4g} allowed]')
 
-        self.subtensor.set_weights(
-            uids=sample_uids.detach().to('cpu'),
-            weights=sample_weights.detach().to('cpu'),
-            wallet=self.wallet,
-            wait_for_finalization=self.config.neuron.wait_for_finalization,
-        )
+        self.set_weights(sample_uids, sample_weights)
 
         # === Wandb Logs ===
         # Optionally send validator logs to wandb.
@@ -608,10 +635,10 @@ class neuron:
                 self.dendrite.to_dataframe( metagraph = self.metagraph )
             ], axis = 1); df['uid'] = df.index
             wandb_data_dend = self.dendrite.to_wandb()
-            wandb_weight = {f'stats/weight_{uid}': weight for uid, weight in zip (sample_uids, sample_weights)}
+            wandb_weight = {f'stats/weight_{uid}': weight for uid, weight in zip (sample_uids.tolist(), sample_weights.tolist())}
             wandb_data = { 'stake': self.metagraph.S[ self.uid ].item(), 'dividends': self.metagraph.D[ self.uid ].item() } 
-            wandb.log( { 'stats': wandb.Table( dataframe = df ) }, step = current_block, commit=False)
-            wandb.log( { **wandb_data, **wandb_data_dend, **wandb_weight }, step = current_block, commit=True)
+            self.wandb_log( { 'stats': wandb.Table( dataframe = df ) }, step = current_block, commit=False)
+            self.wandb_log( { **wandb_data, **wandb_data_dend, **wandb_weight }, step = current_block, commit=True)
 
         # === Epoch Prometheus ===
         self.prometheus_gauges.labels("epoch").inc()
@@ -626,9 +653,90 @@ class neuron:
         # Iterate epochs.
         self.epoch += 1
 
+    def wandb_log(self, data, step, commit=None):
+        r""" Queues a wandb.log call for the wandb logging thread, dropping the oldest queued call when full.
+            The data must only hold Python scalars or objects that are not changed afterwards (e.g. wandb.Table),
+            since it is read on the logging thread.
+        """
+        self._wandb_put((data, step, commit))
+
+    def _wandb_put(self, item):
+        while True:
+            try:
+                self.wandb_queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.wandb_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def wandb_shutdown(self, timeout: float = 10):
+        r""" Sends the remaining queued wandb.log calls and stops the wandb logging thread.
+            Waits at most timeout seconds, so a stuck wandb.log cannot hang the validator on exit.
+        """
+        wandb_thread, self.wandb_thread = self.wandb_thread, None
+        if wandb_thread is None:
+            return
+
+        self._wandb_put(None)  # sentinel, queued behind the remaining calls
+        wandb_thread.join(timeout=timeout)
+        if wandb_thread.is_alive():
+            logger.warning(f'wandb logging thread did not finish within {timeout}s, dropping the remaining logs.')
+
+    def wandb_log_worker(self):
+        r""" Sends queued wandb.log calls in order until the shutdown sentinel, runs on a daemon thread.
+        """
+        while True:
+            item = self.wandb_queue.get()
+            if item is None:
+                return
+            data, step, commit = item
+            try:
+                wandb.log(data, step=step, commit=commit)
+            except Exception as e:
+                logger.warning(f'Failed to log to wandb with error: {e}')
+
+    def set_weights(self, sample_uids, sample_weights):
+        r""" Submits the weights to the chain on the weight setting thread, keeping only one submission in flight.
+        """
+        self.wait_for_weights()
+
+        self.weights_future = self.weights_executor.submit(
+            self._set_weights,
+            uids=sample_uids.detach().to('cpu'),
+            weights=sample_weights.detach().to('cpu')
+        )
+        self.weights_future.add_done_callback(self._set_weights_done)
+
+    def wait_for_weights(self):
+        r""" Blocks until the in-flight set_weights submission, if any, has finished.
+        """
+        if self.weights_future is not None:
+            wait([self.weights_future])
+
+    def _set_weights(self, uids, weights):
+        if self.weights_subtensor is None:
+            self.weights_subtensor = bittensor.subtensor(network=self.subtensor.network,
+                                                         chain_endpoint=self.subtensor.chain_endpoint)
+        return self.weights_subtensor.set_weights(
+            uids=uids,
+            weights=weights,
+            wallet=self.wallet,
+            wait_for_finalization=self.config.neuron.wait_for_finalization,
+        )
+
+    def _set_weights_done(self, future):
+        if future.exception() is not None:
+            logger.warning(f'Failed to set weights with error: {future.exception()}')
+
     def metagraph_sync(self):
         r""" Syncing metagraph together with other metagraph-size related objects
         """
+        # subtensor.set_weights and metagraph.sync both open a status spinner on bittensor.__console__,
+        # and rich raises LiveError for two live displays at once, so the submission has to finish first.
+        self.wait_for_weights()
+
         old_hotkeys = self.neuron_hotkeys + [] if self.neuron_hotkeys else self.metagraph.hotkeys
         self.metagraph.sync()
         self.neuron_hotkeys = self.metagraph.hotkeys
@@ -742,9 +850,11 @@ class neuron:
 
         # === Populate neuron weights ===
         neuron_weights = torch.zeros_like(self.metagraph.S)  # allow unevaluated UIDs for min_allowed_weights
-        for uid in self.neuron_stats:
-            if weight_key in self.neuron_stats[uid]:
-                neuron_weights[uid] = torch.tensor([self.neuron_stats[uid][weight_key]])
+        weighted_uids = [uid for uid in self.neuron_stats if weight_key in self.neuron_stats[uid]]
+        if len(weighted_uids):
+            # single scatter instead of a tensor allocation and index_put per uid
+            neuron_weights[torch.tensor(weighted_uids, dtype=torch.long)] = torch.tensor(
+                [self.neuron_stats[uid][weight_key] for uid in weighted_uids], dtype=neuron_weights.dtype)
 
         # === Filter to non-zero weights ===
         sample_uids = torch.argwhere(neuron_weights > 0).squeeze(dim=1)  # find uids with non-zero weight
@@ -858,8 +968,30 @@ class nucleus( torch.nn.Module ):
 
         self.sigmoid = torch.nn.Sigmoid()
 
+        # Causal attention mask, cached on device and rebuilt only when the sequence length changes.
+        self.src_mask = None
+
+        # Optional TorchScript routing encoder, scripted on the first forward once the nucleus is on its device.
+        # It is kept out of the module tree so parameters() and state_dict() only hold the eager encoder,
+        # whose parameters it shares.
+        object.__setattr__(self, 'scripted_routing_encoder', None)
+
         self.reset_weights()
 
+    def get_routing_encoder(self):
+        r""" Returns the TorchScript routing encoder when --neuron.jit is set and scripting succeeded, else the eager one.
+        """
+        if not self.config.neuron.jit or self.config.neuron.autocast:
+            return self.routing_encoder
+
+        if self.scripted_routing_encoder is None:
+            scripted = jit_script_or_none(self.routing_encoder)
+            object.__setattr__(self, 'scripted_routing_encoder', scripted if scripted is not None else self.routing_encoder)
+
+        # The scripted encoder is not a child module, so it does not follow nucleus.train() / nucleus.eval().
+        self.scripted_routing_encoder.train(self.training)
+        return self.scripted_routing_encoder
+
     @classmethod
     def add_args( cls, parser ):
         parser.add_argument('--nucleus.topk', type=int, help='the number of peers queried during each remote forward call', default = 20 )
@@ -898,6 +1030,14 @@ class nucleus( torch.nn.Module ):
         self.encoder.apply( init_xavier )
         torch.nn.init.xavier_uniform_( self.gates.weight )
     
+    def causal_mask( self, sequence_len: int ) -> torch.FloatTensor:
+        r""" Returns the causal attention mask of shape [sequence_len, sequence_len] on self.device.
+            The mask is built once and reused while the sequence length stays the same.
+        """
+        if self.src_mask is None or self.src_mask.size(0) != sequence_len:
+            self.src_mask = torch.triu(torch.ones(sequence_len, sequence_len, device=self.device) * float('-inf'), diagonal=1)
+        return self.src_mask
+
     def forward(
             self,
             inputs: torch.FloatTensor,
@@ -940,8 +1080,7 @@ class nucleus( torch.nn.Module ):
         # This prevents cheating and forward-looking when predicting each token in the sequence.
         # src_mask: (torch.FloatTensor) attention mask adds -inf to positions not allowed to attend
         # src_mask.shape = [sequence_len, sequence_len]
-        src_mask = torch.triu(torch.ones(embedding.size(1), embedding.size(1)) * float('-inf'), diagonal=1)
-        src_mask = src_mask.to(self.device)
+        src_mask = self.causal_mask(embedding.size(1))
 
         # === Apply the positional encoding to help select endpoints ===
         # The positional encoder provides information based on the relative postion of each token
@@ -950,17 +1089,23 @@ class nucleus( torch.nn.Module ):
         # pos_embedding.shape = [batch_size, sequence_len, bittensor.__network_dim__]
         pos_embedding = self.local_pos_encoder(embedding)
 
-        # routing_context: (torch.FloatTensor): context tensor which is used to select endpoints.
-        # routing_context.shape = [ batch size, __network_dim__ ]
-        routing_context = self.routing_encoder(pos_embedding, mask=src_mask)
+        # === Optional mixed precision ===
+        # The routing encoder and gates are the validator's own matmul-heavy compute, optionally run under
+        # bfloat16 autocast (no gradient scaling needed). Response validation below stays in float32.
+        with torch.autocast(device_type=self.device.type, dtype=torch.bfloat16, enabled=self.config.neuron.autocast):
+            # routing_context: (torch.FloatTensor): context tensor which is used to select endpoints.
+            # routing_context.shape = [ batch size, __network_dim__ ]
+            routing_context = self.get_routing_encoder()(pos_embedding, mask=src_mask)
 
-        # === Get gate values for UIDs. ===
-        # We iterate over each of the network UIDs and compute a querying score for each
-        # using the gating function. This returns a score per endpoint per example.
-        # routing_score: (torch.FloatTensor): score per example, per endpoint.
-        # routing_score.shape = [metagraph.n]
-        # The gates act over the last embedding of the routing_context.
-        routing_score = torch.mean(self.sigmoid(self.gates(routing_context[:, -1, :])), dim=0)
+            # === Get gate values for UIDs. ===
+            # We iterate over each of the network UIDs and compute a querying score for each
+            # using the gating function. This returns a score per endpoint per example.
+            # routing_score: (torch.FloatTensor): score per example, per endpoint.
+            # routing_score.shape = [metagraph.n]
+            # The gates act over the last embedding of the routing_context.
+            routing_score = torch.mean(self.sigmoid(self.gates(routing_context[:, -1, :])), dim=0)
+
+        routing_score = routing_score.float()
 
         # Ensure number of queried neurons does not exceed metagraph.n
         num_endpoints = min([self.config.nucleus.topk, metagraph.n])
@@ -1158,9 +1303,7 @@ def textcausallm(uids: torch.Tensor, query_responses: List[List[torch.FloatTenso
         if 'shapley_values' in s and 'shapley_values_val' in s:
             s['shapley_values_min'] = torch.min(s['shapley_values'], s['shapley_values_val'])
 
-        for key in s:
-            if hasattr(s[key], 'item'):
-                s[key] = s[key].item()
+    stats_to_floats(stats)
 
     logger.info(f'{str(synapse)} \t| Shapley synergy values (power={synergy_scaling_law_power:.1f})'
                 f'<dim>[{time.time() - synergy_start_time:.3g}s]</dim>')
@@ -1269,9 +1412,7 @@ def textcausallmnext(uids: torch.Tensor, query_responses: List[List[torch.FloatT
         if 'losses_nxt' in s:
             del s['losses_nxt']  # remove batch losses - not needed for stats anymore
 
-        for key in s:
-            if hasattr(s[key], 'item'):
-                s[key] = s[key].item()
+    stats_to_floats(stats)
 
     if logging:
         # === Response table ===
@@ -1373,6 +1514,53 @@ def shapley_base(uids: torch.Tensor, query_responses: List[List[torch.FloatTenso
     return neuron_loss + routing_loss, stats, unsuccessful
 
 
+def jit_script_or_none(module: torch.nn.Module):
+    r"""
+    Scripts the module with torch.jit.script, the scripted module shares the parameters of the original.
+        Args:
+            module (:obj:`torch.nn.Module`, `required`):
+                Module to script.
+
+        Returns:
+            scripted (:obj:`torch.jit.ScriptModule`):
+                The scripted module, or None if the module could not be scripted.
+    """
+    try:
+        return torch.jit.script(module)
+    except Exception as e:
+        logger.warning(f'Could not script {type(module).__name__}, running it eagerly: {e}')
+        return None
+
+
+def stats_to_floats(stats: Dict):
+    r"""
+    Converts the scalar values of the per-endpoint stats to Python numbers in place, like calling .item() on each.
+    Tensor values are stacked per device and kind and transferred with one host sync per group, instead of one
+    .item() call per value. Floating tensors become floats, integer tensors ints and bool tensors bools.
+        Args:
+            stats (:obj:`Dict`, `required`):
+                Statistics per endpoint for this batch.
+    """
+    entries = {}  # (device, stack dtype) -> [(stats dict, key)] of tensor values
+    for _stats in stats.values():
+        for key, value in _stats.items():
+            if isinstance(value, torch.Tensor):
+                if value.dtype == torch.bool:
+                    dtype = torch.bool
+                elif value.is_floating_point():
+                    dtype = torch.float64
+                else:
+                    dtype = torch.int64
+                entries.setdefault((value.device, dtype), []).append((_stats, key))
+            elif hasattr(value, 'item'):
+                _stats[key] = value.item()
+
+    for (_, dtype), group in entries.items():
+        values = torch.stack([_stats[key].detach().reshape(()).to(dtype) for _stats, key in group]).tolist()
+        for (_stats, key), value in zip(group, values):
+            _stats[key] = value
+
+
 def logits_divergence(stats: Dict, uids: torch.Tensor, query_responses: List[List[torch.FloatTensor]],
                       return_ops: List[torch.LongTensor], times: List[torch.FloatTensor],
                       index_s: int = 0, ext: str = None):
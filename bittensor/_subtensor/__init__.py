@@ -96,7 +96,8 @@ class subtensor:
                     Returned object is mocks the underlying chain connection.
         """
         if config == None: config = subtensor.config()
-        config = copy.deepcopy( config )
+        config = copy.copy( config )
+        config.subtensor = copy.deepcopy( config.subtensor )
 
         # Returns a mocked connection with a background chain connection.
         config.subtensor._mock = _mock if _mock != None else config.subtensor._mock
@@ -43,7 +43,9 @@ class prioritythreadpool:
         """        
         if config == None: 
             config = prioritythreadpool.config()
-        config = copy.deepcopy( config )
+        config = copy.copy( config )
+        config.axon = copy.copy( config.axon )
+        config.axon.priority = copy.deepcopy( config.axon.priority )
         config.axon.priority.max_workers = max_workers if max_workers != None else config.axon.priority.max_workers
         config.axon.priority.maxsize = maxsize if maxsize != None else config.axon.priority.maxsize
 
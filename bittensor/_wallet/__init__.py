@@ -59,7 +59,8 @@ class wallet:
         """
         if config == None: 
             config = wallet.config()
-        config = copy.deepcopy( config )
+        config = copy.copy( config )
+        config.wallet = copy.deepcopy( config.wallet )
         config.wallet.name = name if name != None else config.wallet.name
         config.wallet.hotkey = hotkey if hotkey != None else config.wallet.hotkey
         config.wallet.path = path if path != None else config.wallet.path
@@ -60,7 +60,8 @@ class wandb:
         """
         if config == None: 
             config = wandb.config()
-        config = copy.deepcopy( config )
+        config = copy.copy( config )
+        config.wandb = copy.deepcopy( config.wandb )
         config.wandb.api_key = api_key if api_key != None else config.wandb.api_key
         config.wandb.name = name if name != None else config.wandb.name
         config.wandb.project = project if project != None else config.wandb.project
@@ -2,6 +2,7 @@ import binascii
 import hashlib
 import math
 import multiprocessing
+import multiprocessing.connection
 import os
 import random
 import time
@@ -447,6 +448,7 @@ def solve_for_difficulty_fast( subtensor, wallet, output_in_place: bool = True,
     
     for worker in solvers:
         worker.start() # start the solver processes
+    solver_sentinels = {worker.sentinel: worker for worker in solvers} # sentinels only exist once started
 
     start_time = time.time() # time that the registration started
     time_last = start_time # time that the last work blocks completed
@@ -475,37 +477,36 @@ def solve_for_difficulty_fast( subtensor, wallet, output_in_place: bool = True,
     hash_rates = [0] * n_samples # The last n true hash_rates
     weights = [alpha_ ** i for i in range(n_samples)] # weights decay by alpha
     
+    # Minimum seconds between chain polls for a new block, the wait below only wakes early for a solution
+    # or a solver exit, so without it an early wake-up would go straight back to the chain.
+    block_poll_interval = 0.25
+    next_block_poll = time.time() + block_poll_interval
     while not wallet.is_registered(subtensor):
-        # Wait until a solver finds a solution
+        # Wait until a solver finds a solution or a solver exits, at most until the next block poll is due
         try:
-            solution = solution_queue.get(block=True, timeout=0.25)
-            if solution is not None:
-                break
-        except Empty:
-            # No solution found, try again
-            pass
+            solution = wait_for_solution_or_exit(solution_queue, solver_sentinels, timeout=max(0.0, next_block_poll - time.time()))
+        except ChildProcessError:
+            logger.stop()
+            raise
+        if solution is not None:
+            break
 
         # check for new block
-        old_block_number = check_for_newest_block_and_update(
-            subtensor = subtensor,
-            old_block_number=old_block_number,
-            curr_diff=curr_diff,
-            curr_block=curr_block,
-            curr_block_num=curr_block_num,
-            curr_stats=curr_stats,
-            update_curr_block=update_curr_block,
-            check_block=check_block,
-            solvers=solvers
-        )
+        if time.time() >= next_block_poll:
+            old_block_number = check_for_newest_block_and_update(
+                subtensor = subtensor,
+                old_block_number=old_block_number,
+                curr_diff=curr_diff,
+                curr_block=curr_block,
+                curr_block_num=curr_block_num,
+                curr_stats=curr_stats,
+                update_curr_block=update_curr_block,
+                check_block=check_block,
+                solvers=solvers
+            )
+            next_block_poll = time.time() + block_poll_interval
                 
-        num_time = 0
-        for finished_queue in finished_queues:
-            try:
-                proc_num = finished_queue.get(timeout=0.1)
-                num_time += 1
-
-            except Empty:
-                continue
+        num_time = count_finished_blocks(finished_queues)
         
         time_now = time.time() # get current time
         time_since_last = time_now - time_last # get time since last work block(s)
@@ -555,23 +556,48 @@ def get_block_with_retry(subtensor: 'bittensor.Subtensor') -> Tuple[int, int, by
     return block_number, difficulty, block_hash
 
 
-class UsingSpawnStartMethod():
-    def __init__(self, force: bool = False):
+class UsingStartMethod():
+    def __init__(self, start_method: str, force: bool = False, forkserver_preload: Optional[List[str]] = None):
+        self._start_method = start_method
         self._old_start_method = None
         self._force = force
+        self._forkserver_preload = forkserver_preload
 
     def __enter__(self):
         self._old_start_method = multiprocessing.get_start_method(allow_none=True)
         if self._old_start_method == None:
             self._old_start_method = 'spawn' # default to spawn
 
-        multiprocessing.set_start_method('spawn', force=self._force)
+        if self._start_method == 'forkserver' and self._forkserver_preload:
+            # Only read when the fork server is first started, which is the first process started in this context.
+            multiprocessing.set_forkserver_preload(self._forkserver_preload)
+        multiprocessing.set_start_method(self._start_method, force=self._force)
 
     def __exit__(self, *args):
         # restore the old start method
         multiprocessing.set_start_method(self._old_start_method, force=True)
 
 
+class UsingSpawnStartMethod(UsingStartMethod):
+    def __init__(self, force: bool = False):
+        super().__init__('spawn', force=force)
+
+
+def cuda_solver_start_method() -> str:
+    r""" Returns the start method used for the CUDA solver processes.
+        CUDA cannot be used in a plainly forked child, so the solvers need a fresh interpreter.
+        'spawn' re-imports torch and bittensor in every child, which takes seconds per solver.
+        'forkserver' starts one clean server process (it is not a fork of the parent, so a CUDA
+        context in the parent is never inherited), preloads the imports there once and forks each
+        solver from it cheaply. The tradeoff is the same pickling constraints as 'spawn' and one
+        long-lived server process. Falls back to 'spawn' where 'forkserver' is unavailable.
+        The preload itself is set by UsingStartMethod when the method is entered.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return 'forkserver'
+    return 'spawn'
+
+
 def check_for_newest_block_and_update(
     subtensor: 'bittensor.Subtensor',
     old_block_number: int,
@@ -670,8 +696,8 @@ def solve_for_difficulty_fast_cuda( subtensor: 'bittensor.Subtensor', wallet: 'b
         
     limit = int(math.pow(2,256)) - 1
 
-    # Set mp start to use spawn so CUDA doesn't complain
-    with UsingSpawnStartMethod(force=True):
+    # Set mp start to use forkserver (or spawn) so CUDA doesn't complain
+    with UsingStartMethod(cuda_solver_start_method(), force=True, forkserver_preload=['torch', 'bittensor']):
         curr_block = multiprocessing.Array('h', 64, lock=True) # byte array
         curr_block_num = multiprocessing.Value('i', 0, lock=True) # int
         curr_diff = multiprocessing.Array('Q', [0, 0], lock=True) # [high, low]
@@ -709,6 +735,7 @@ def solve_for_difficulty_fast_cuda( subtensor: 'bittensor.Subtensor', wallet: 'b
         
         for worker in solvers:
             worker.start() # start the solver processes
+        solver_sentinels = {worker.sentinel: worker for worker in solvers} # sentinels only exist once started
         
         start_time = time.time() # time that the registration started
         time_last = start_time # time that the last work blocks completed
@@ -735,38 +762,37 @@ def solve_for_difficulty_fast_cuda( subtensor: 'bittensor.Subtensor', wallet: 'b
         weights = [alpha_ ** i for i in range(n_samples)] # weights decay by alpha
 
         solution = None
+        # Minimum seconds between chain polls for a new block, the wait below only wakes early for a solution
+        # or a solver exit, so without it an early wake-up would go straight back to the chain.
+        block_poll_interval = 0.15
+        next_block_poll = time.time() + block_poll_interval
         while not wallet.is_registered(subtensor):
-            # Wait until a solver finds a solution
+            # Wait until a solver finds a solution or a solver exits, at most until the next block poll is due
             try:
-                solution = solution_queue.get(block=True, timeout=0.15)
-                if solution is not None:
-                    break
-            except Empty:
-                # No solution found, try again
-                pass
+                solution = wait_for_solution_or_exit(solution_queue, solver_sentinels, timeout=max(0.0, next_block_poll - time.time()))
+            except ChildProcessError:
+                logger.stop()
+                raise
+            if solution is not None:
+                break
             
             # check for new block
-            old_block_number = check_for_newest_block_and_update(
-                subtensor = subtensor,
-                curr_diff=curr_diff,
-                curr_block=curr_block,
-                curr_block_num=curr_block_num,
-                old_block_number=old_block_number,
-                curr_stats=curr_stats,
-                update_curr_block=update_curr_block,
-                check_block=check_block,
-                solvers=solvers
-            )
+            if time.time() >= next_block_poll:
+                old_block_number = check_for_newest_block_and_update(
+                    subtensor = subtensor,
+                    curr_diff=curr_diff,
+                    curr_block=curr_block,
+                    curr_block_num=curr_block_num,
+                    old_block_number=old_block_number,
+                    curr_stats=curr_stats,
+                    update_curr_block=update_curr_block,
+                    check_block=check_block,
+                    solvers=solvers
+                )
+                next_block_poll = time.time() + block_poll_interval
                     
-            num_time = 0
             # Get times for each solver
-            for finished_queue in finished_queues:
-                try:
-                    proc_num = finished_queue.get(timeout=0.1)
-                    num_time += 1
-            
-                except Empty:
-                    continue
+            num_time = count_finished_blocks(finished_queues)
             
             time_now = time.time() # get current time
             time_since_last = time_now - time_last # get time since last work block(s)
@@ -804,6 +830,57 @@ def solve_for_difficulty_fast_cuda( subtensor: 'bittensor.Subtensor', wallet: 'b
         return solution
 
 
+def wait_for_solution_or_exit(solution_queue: multiprocessing.Queue, solver_sentinels: Dict[int, SolverBase], timeout: float) -> Optional[POWSolution]:
+    """
+    Blocks until a solver puts a solution on the solution queue, a solver process exits, or the timeout passes.
+
+    Args:
+        solution_queue (:obj:`multiprocessing.Queue`, `required`):
+            The queue the solvers put their solutions on.
+        solver_sentinels (:obj:`Dict[int, SolverBase]`, `required`):
+            The running solver processes keyed by their sentinel, built once after they are started.
+        timeout (:obj:`float`, `required`):
+            The maximum number of seconds to wait.
+
+    Returns:
+        (Optional[POWSolution]) The solution if one was found within the timeout, None otherwise.
+
+    Raises:
+        ChildProcessError: If a solver exited before a solution was found. The remaining solvers are terminated.
+    """
+    # The read end of the queue pipe can be waited on together with the process sentinels,
+    # the same way concurrent.futures.ProcessPoolExecutor watches its workers.
+    ready = multiprocessing.connection.wait([solution_queue._reader, *solver_sentinels], timeout=timeout)
+    if solution_queue._reader in ready:
+        try:
+            return solution_queue.get_nowait()
+        except Empty:
+            pass
+
+    for sentinel in ready:
+        solver = solver_sentinels.get(sentinel)
+        if solver is not None:
+            terminate_workers_and_wait_for_exit(list(solver_sentinels.values()))
+            raise ChildProcessError(f"Solver process {solver.proc_num} exited unexpectedly with exit code {solver.exitcode}")
+
+    return None
+
+
+def count_finished_blocks(finished_queues: List[multiprocessing.Queue]) -> int:
+    r""" Drains the solvers' finished queues without blocking and returns the number of nonce blocks completed.
+        The solution wait already paces the loop, so nothing here needs a timeout.
+    """
+    num_finished = 0
+    for finished_queue in finished_queues:
+        while True:
+            try:
+                finished_queue.get_nowait()
+            except Empty:
+                break
+            num_finished += 1
+    return num_finished
+
+
 def terminate_workers_and_wait_for_exit(workers: List[multiprocessing.Process]) -> None:
     for worker in workers:
         worker.terminate()
@@ -20,6 +20,7 @@ from sys import prefix
 import bittensor
 import argparse
 import pytest
+from unittest.mock import patch
 
 
 def test_loaded_config():
@@ -128,6 +129,39 @@ def test_to_defaults():
     config = construct_config()
     config.to_defaults()
 
+def test_wallet_copies_only_its_subtree():
+    # Components deep-copy the subtree they override and share the rest with the caller.
+    parser = argparse.ArgumentParser()
+    bittensor.wallet.add_args( parser )
+    bittensor.subtensor.add_args( parser )
+    config = bittensor.config( parser, strict=False )
+    name = config.wallet.name
+
+    wallet = bittensor.wallet( config, name = 'isolated', hotkey = 'isolated', _mock = True )
+    assert wallet.config.wallet.name == 'isolated'
+    assert config.wallet.name == name
+    assert wallet.config.wallet is not config.wallet
+    assert wallet.config.subtensor is config.subtensor
+
+def test_prioritythreadpool_copies_only_axon_priority():
+    # prioritythreadpool overrides axon.priority only, so axon is copied shallowly and axon.priority deeply.
+    parser = argparse.ArgumentParser()
+    bittensor.axon.add_args( parser )
+    bittensor.prioritythreadpool.add_args( parser )
+    config = bittensor.config( parser, strict=False )
+    max_workers = config.axon.priority.max_workers
+
+    with patch.object( bittensor.prioritythreadpool, 'check_config' ) as check_config:
+        bittensor.prioritythreadpool( config, max_workers = max_workers + 1, maxsize = 10 ).shutdown()
+    pool_config = check_config.call_args[0][0]
+
+    assert pool_config.axon.priority.max_workers == max_workers + 1
+    assert config.axon.priority.max_workers == max_workers
+    assert pool_config.axon is not config.axon
+    assert pool_config.axon.priority is not config.axon.priority
+    pool_config.axon.port = -1
+    assert config.axon.port != -1
+
 if __name__  == "__main__":
     # test_loaded_config()
     # test_strict()
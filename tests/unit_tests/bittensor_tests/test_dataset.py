@@ -0,0 +1,83 @@
+# The MIT License (MIT)
+# Copyright © 2021 Yuma Rao
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated 
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation 
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, 
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of 
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL 
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION 
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER 
+# DEALINGS IN THE SOFTWARE.
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bittensor._dataset.dataset_impl import GenesisTextDataset
+
+def local_dataset(data_dir, ipfs_text=None):
+    r""" GenesisTextDataset with only the disk cache state set, IPFS is mocked and never contacted.
+    """
+    dataset = object.__new__(GenesisTextDataset)
+    dataset.data_dir = str(data_dir)
+    dataset.text_dir = 'text_dir'
+    dataset.save_dataset = True
+    dataset.backup_dataset_cap_size = 5e7
+    dataset.dataset_hashes = {'folder': {'Size': 0}}
+    dataset.IPFS_fails = 0
+    dataset.data_queue = MagicMock()
+    dataset.get_ipfs_directory = MagicMock(return_value=MagicMock(status_code=200, text=ipfs_text))
+    return dataset
+
+file_meta = {'Name': 'file', 'Folder': 'folder', 'Hash': 'hash', 'Size': 10}
+
+def test_save_hash_replaces_atomically_with_umask_permissions(tmp_path):
+    dataset = local_dataset(tmp_path)
+    assert dataset.save_hash(file_meta, 'some text')
+
+    folder = tmp_path / 'folder'
+    assert (folder / 'hash').read_text() == 'some text'
+    assert os.listdir(folder) == ['hash']  # no temp file left behind
+
+    umask = os.umask(0)
+    os.umask(umask)
+    assert os.stat(folder / 'hash').st_mode & 0o777 == 0o666 & ~umask
+
+def test_save_hash_failure_leaves_no_file(tmp_path):
+    dataset = local_dataset(tmp_path)
+    with patch('os.replace', side_effect=OSError('disk full')):
+        assert not dataset.save_hash(file_meta, 'some text')
+
+    assert os.listdir(tmp_path / 'folder') == []
+
+def test_get_text_prefers_local_copy(tmp_path):
+    dataset = local_dataset(tmp_path, ipfs_text='downloaded')
+    dataset.save_hash(file_meta, 'saved')
+
+    assert dataset.get_text(file_meta) == 'saved'
+    dataset.get_ipfs_directory.assert_not_called()
+
+@pytest.mark.parametrize('content', [b'', b'\xff\xfe\xfa'])
+def test_get_text_downloads_empty_or_unreadable_local_copy(tmp_path, content):
+    dataset = local_dataset(tmp_path, ipfs_text='downloaded')
+    os.makedirs(tmp_path / 'folder')
+    (tmp_path / 'folder' / 'hash').write_bytes(content)
+
+    assert dataset.get_text(file_meta) == 'downloaded'
+    dataset.get_ipfs_directory.assert_called_once()
+    assert (tmp_path / 'folder' / 'hash').read_text() == 'downloaded'  # the bad copy is replaced
+
+def test_get_text_from_local_skips_dotfiles(tmp_path):
+    dataset = local_dataset(tmp_path)
+    dataset.dataset_name = 'default'
+    dataset.max_datasets = 1
+    dataset.save_hash(file_meta, 'saved words')
+    (tmp_path / 'folder' / '.hash.0.tmp').write_text('partial')
+
+    assert dataset.get_text_from_local(min_data_len=100) == ['saved', 'words']
@@ -252,6 +252,180 @@ def test_corevalidator_reregister_flag_true():
 class MockException(Exception):
     pass
 
+def test_corevalidator_set_weights_waits_for_pending_submission():
+    pending_future = MagicMock()
+    mock_self_neuron = MagicMock(
+        spec=bittensor.neurons.core_validator.neuron,
+        weights_future=pending_future,
+        weights_executor=MagicMock(),
+    )
+    mock_self_neuron.wait_for_weights = lambda: bittensor.neurons.core_validator.neuron.wait_for_weights(mock_self_neuron)
+
+    with patch('bittensor._neuron.text.core_validator.wait') as mock_wait:
+        bittensor.neurons.core_validator.neuron.set_weights(mock_self_neuron, torch.tensor([0, 1]), torch.tensor([0.5, 0.5]))
+
+    # Only one submission is kept in flight, the previous one is waited on before submitting.
+    mock_wait.assert_called_once_with([pending_future])
+    mock_self_neuron.weights_executor.submit.assert_called_once()
+    assert mock_self_neuron.weights_future == mock_self_neuron.weights_executor.submit.return_value
+    mock_self_neuron.weights_future.add_done_callback.assert_called_once_with(mock_self_neuron._set_weights_done)
+
+def test_corevalidator_set_weights_done_logs_failure():
+    from concurrent.futures import Future
+    mock_self_neuron = MagicMock(spec=bittensor.neurons.core_validator.neuron)
+
+    failed_future = Future()
+    failed_future.set_exception(Exception('chain error'))
+    succeeded_future = Future()
+    succeeded_future.set_result(True)
+
+    with patch('bittensor._neuron.text.core_validator.logger') as mock_logger:
+        bittensor.neurons.core_validator.neuron._set_weights_done(mock_self_neuron, succeeded_future)
+        mock_logger.warning.assert_not_called()
+
+        bittensor.neurons.core_validator.neuron._set_weights_done(mock_self_neuron, failed_future)
+        mock_logger.warning.assert_called_once()
+        assert 'chain error' in mock_logger.warning.call_args[0][0]
+
+def test_corevalidator_set_weights_uses_dedicated_subtensor():
+    mock_self_neuron = MagicMock(
+        spec=bittensor.neurons.core_validator.neuron,
+        weights_subtensor=None,
+        subtensor=MagicMock(network='nakamoto', chain_endpoint='localhost:9944'),
+        wallet=MagicMock(),
+        config=MagicMock(),
+    )
+    mock_weights_subtensor = MagicMock()
+
+    with patch('bittensor.subtensor', return_value=mock_weights_subtensor) as mock_new_subtensor:
+        for _ in range(2):
+            bittensor.neurons.core_validator.neuron._set_weights(mock_self_neuron, torch.tensor([0]), torch.tensor([1.0]))
+
+    # The connection is created once, lazily, and the main thread's subtensor is never used for the extrinsic.
+    mock_new_subtensor.assert_called_once_with(network='nakamoto', chain_endpoint='localhost:9944')
+    assert mock_weights_subtensor.set_weights.call_count == 2
+    mock_self_neuron.subtensor.set_weights.assert_not_called()
+
+def test_corevalidator_jit_script_routing_encoder():
+    from bittensor._neuron.text.core_validator import jit_script_or_none
+
+    routing_encoder = TransformerEncoder(TransformerEncoderLayer(16, 2, 32, 0.2, batch_first=True), 1)
+    scripted = jit_script_or_none(routing_encoder)
+    assert scripted is not None
+
+    # The scripted encoder shares the eager parameters, so the optimizer and state_dict keep using the eager module.
+    assert scripted.layers[0].linear1.weight.data_ptr() == routing_encoder.layers[0].linear1.weight.data_ptr()
+
+    routing_encoder.eval()
+    scripted.eval()
+    inputs = torch.randn(2, 5, 16)
+    mask = torch.triu(torch.ones(5, 5) * float('-inf'), diagonal=1)
+    assert torch.allclose(scripted(inputs, mask=mask), routing_encoder(inputs, mask=mask), atol=1e-5)
+
+def test_corevalidator_jit_script_falls_back_to_eager():
+    from bittensor._neuron.text.core_validator import jit_script_or_none
+
+    class Unscriptable(nn.Module):
+        def forward(self, *args, **kwargs):
+            return args
+
+    assert jit_script_or_none(Unscriptable()) is None
+
+def test_corevalidator_stats_to_floats():
+    from bittensor._neuron.text.core_validator import stats_to_floats
+
+    stats = {
+        0: {'loss': torch.tensor(1.5), 'updates': torch.tensor(3), 'responsive': torch.tensor(True),
+            'shapley': torch.tensor([0.25]), 'uid': 0, 'name': 'a'},
+        1: {'loss': torch.tensor(2.5, dtype=torch.float16), 'numpy': torch.tensor(4).numpy()},
+        2: {},
+    }
+    stats_dicts = list(stats.values())
+    stats_to_floats(stats)
+
+    # Converted in place, with the Python types .item() returns.
+    assert all(stats[uid] is _stats for uid, _stats in zip(stats, stats_dicts))
+    assert stats[0] == {'loss': 1.5, 'updates': 3, 'responsive': True, 'shapley': 0.25, 'uid': 0, 'name': 'a'}
+    assert type(stats[0]['loss']) is float
+    assert type(stats[0]['updates']) is int
+    assert type(stats[0]['responsive']) is bool
+    assert type(stats[0]['shapley']) is float
+    assert stats[1] == {'loss': 2.5, 'numpy': 4}
+    assert type(stats[1]['loss']) is float
+    assert type(stats[1]['numpy']) is int
+    assert stats[2] == {}
+
+    empty_stats = {}
+    stats_to_floats(empty_stats)
+    assert empty_stats == {}
+
+def mock_wandb_neuron(maxsize):
+    import queue
+
+    mock_self_neuron = MagicMock(
+        spec=bittensor.neurons.core_validator.neuron,
+        wandb_queue=queue.Queue(maxsize=maxsize),
+        wandb_thread=None,
+    )
+    mock_self_neuron._wandb_put = lambda item: bittensor.neurons.core_validator.neuron._wandb_put(mock_self_neuron, item)
+    return mock_self_neuron
+
+def start_wandb_thread(mock_self_neuron):
+    import threading
+
+    mock_self_neuron.wandb_thread = threading.Thread(
+        target=bittensor.neurons.core_validator.neuron.wandb_log_worker, args=(mock_self_neuron,), daemon=True)
+    mock_self_neuron.wandb_thread.start()
+
+def test_corevalidator_wandb_log_drops_oldest():
+    mock_self_neuron = mock_wandb_neuron(maxsize=2)
+
+    for step in range(3):
+        bittensor.neurons.core_validator.neuron.wandb_log(mock_self_neuron, {'step': step}, step=step, commit=True)
+
+    # The queue is full after two calls, so the third call drops the oldest entry.
+    assert mock_self_neuron.wandb_queue.get_nowait() == ({'step': 1}, 1, True)
+    assert mock_self_neuron.wandb_queue.get_nowait() == ({'step': 2}, 2, True)
+    assert mock_self_neuron.wandb_queue.empty()
+
+def test_corevalidator_wandb_shutdown_flushes_queue():
+    mock_self_neuron = mock_wandb_neuron(maxsize=64)
+    for step in range(3):
+        mock_self_neuron.wandb_queue.put(({'step': step}, step, True))
+
+    with patch('wandb.log') as mock_wandb_log:
+        start_wandb_thread(mock_self_neuron)
+        bittensor.neurons.core_validator.neuron.wandb_shutdown(mock_self_neuron)
+
+        # Every queued call is sent before the thread stops.
+        assert [call.kwargs['step'] for call in mock_wandb_log.call_args_list] == [0, 1, 2]
+        assert mock_self_neuron.wandb_thread is None
+
+        # A second shutdown is a no-op.
+        bittensor.neurons.core_validator.neuron.wandb_shutdown(mock_self_neuron)
+        assert mock_wandb_log.call_count == 3
+
+def test_corevalidator_wandb_shutdown_does_not_hang_on_stuck_log():
+    import threading
+
+    mock_self_neuron = mock_wandb_neuron(maxsize=1)
+    release = threading.Event()
+
+    with patch('wandb.log', side_effect=lambda *args, **kwargs: release.wait()):
+        start_wandb_thread(mock_self_neuron)
+        mock_self_neuron.wandb_queue.put(({'step': 0}, 0, True))
+        mock_self_neuron.wandb_queue.put(({'step': 1}, 1, True))  # the worker is stuck, so the queue is full
+
+        # The sentinel is queued without blocking and the join gives up after the timeout.
+        wandb_thread = mock_self_neuron.wandb_thread
+        bittensor.neurons.core_validator.neuron.wandb_shutdown(mock_self_neuron, timeout=0.1)
+        assert wandb_thread.is_alive()
+        assert mock_self_neuron.wandb_thread is None
+
+        release.set()
+        wandb_thread.join(timeout=10)
+        assert not wandb_thread.is_alive()
+
 class TestBlacklist(unittest.TestCase):
 
     @staticmethod
@@ -4,6 +4,7 @@ import math
 import multiprocessing
 import os
 import random
+import queue
 import subprocess
 import sys
 import time
@@ -208,6 +209,73 @@ def test_solve_for_difficulty_fast_missing_hash():
     seal = solution.seal
     assert bittensor.utils.seal_meets_difficulty(seal, 10)
 
+def test_wait_for_solution_or_exit_raises_on_solver_exit():
+    solution_queue = multiprocessing.Queue()
+    solver = multiprocessing.Process(target=time.sleep, args=(0,), daemon=True)
+    solver.proc_num = 0
+    solver.start()
+
+    with pytest.raises(ChildProcessError):
+        bittensor.utils.wait_for_solution_or_exit(solution_queue, {solver.sentinel: solver}, timeout=10)
+
+def test_wait_for_solution_or_exit_returns_solution():
+    solution_queue = multiprocessing.Queue()
+    solver = multiprocessing.Process(target=time.sleep, args=(10,), daemon=True)
+    solver.proc_num = 0
+    solver.start()
+
+    assert bittensor.utils.wait_for_solution_or_exit(solution_queue, {solver.sentinel: solver}, timeout=0.1) is None
+
+    expected = bittensor.utils.POWSolution(nonce=1, block_number=2, difficulty=3, seal=b'seal')
+    solution_queue.put(expected)
+    assert bittensor.utils.wait_for_solution_or_exit(solution_queue, {solver.sentinel: solver}, timeout=10) == expected
+
+    bittensor.utils.terminate_workers_and_wait_for_exit([solver])
+
+def test_count_finished_blocks():
+    # One entry per queue, each waited on until it is readable from the queue pipe.
+    finished_queues = [multiprocessing.Queue() for _ in range(3)]
+    for proc_num, finished_queue in enumerate(finished_queues):
+        finished_queue.put(proc_num)
+    for finished_queue in finished_queues:
+        assert finished_queue._reader.poll(10)
+
+    assert bittensor.utils.count_finished_blocks(finished_queues) == 3
+    assert bittensor.utils.count_finished_blocks(finished_queues) == 0
+
+def test_count_finished_blocks_drains_each_queue():
+    # queue.Queue puts are synchronous, so several entries per queue are readable without waiting.
+    finished_queues = [queue.Queue() for _ in range(2)]
+    finished_queues[0].put(0)
+    finished_queues[0].put(0)
+    finished_queues[1].put(1)
+
+    assert bittensor.utils.count_finished_blocks(finished_queues) == 3
+    assert all(finished_queue.empty() for finished_queue in finished_queues)
+
+@pytest.mark.parametrize('start_methods, expected', [
+    (['fork', 'spawn', 'forkserver'], 'forkserver'),
+    (['spawn'], 'spawn'),
+])
+def test_cuda_solver_start_method(start_methods, expected):
+    with patch('multiprocessing.get_all_start_methods', return_value=start_methods), \
+            patch('multiprocessing.set_forkserver_preload') as mock_preload:
+        assert bittensor.utils.cuda_solver_start_method() == expected
+    mock_preload.assert_not_called()
+
+@pytest.mark.parametrize('start_method, preloaded', [('forkserver', True), ('spawn', False)])
+def test_using_start_method_forkserver_preload(start_method, preloaded):
+    with patch('multiprocessing.get_start_method', return_value='fork'), \
+            patch('multiprocessing.set_start_method') as mock_set_start_method, \
+            patch('multiprocessing.set_forkserver_preload') as mock_preload:
+        with bittensor.utils.UsingStartMethod(start_method, force=True, forkserver_preload=['torch', 'bittensor']):
+            mock_set_start_method.assert_called_once_with(start_method, force=True)
+
+    assert mock_preload.called == preloaded
+    if preloaded:
+        mock_preload.assert_called_once_with(['torch', 'bittensor'])
+    mock_set_start_method.assert_called_with('fork', force=True)
+
 def test_is_valid_ss58_address():
     keypair = bittensor.Keypair.create_from_mnemonic(
         bittensor.Keypair.generate_mnemonic(